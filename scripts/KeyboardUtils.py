@@ -183,7 +183,6 @@ class _KeybdUnix:
             [i, o, e] = select([sys.stdin.fileno()], [], [], .001)
             if i:
                 return sys.stdin.read(1)
-        print(".", end="")
         return None
 
     def close(self):
@@ -23,9 +23,8 @@ class LogHelper:
 
         # Log to file if required
         if logToFile:
-            # Check the log folder exists
-            if not os.path.exists(logsFolder):
-                os.mkdir(logsFolder)
+            # Ensure the log folder exists
+            os.makedirs(logsFolder, exist_ok=True)
             
             # Form log file name
             logFileName = time.strftime("%Y%m%d-%H%M%S") + ".log"
@@ -155,9 +154,10 @@ class InputLine:
          return len(self._inLineBuf) != 0
 
     def show(self):
-        sys.stdout.write(Terminal.LINE_CLEAR_ALL + Terminal.CURSOR_LINE_START + self._inLineBuf)
+        outStr = Terminal.LINE_CLEAR_ALL + Terminal.CURSOR_LINE_START + self._inLineBuf
         if len(self._inLineBuf) != self._inLinePos:
-            Terminal.cursorLeft(len(self._inLineBuf) - self._inLinePos)
+            outStr += Terminal.cursorLeftStr(len(self._inLineBuf) - self._inLinePos)
+        sys.stdout.write(outStr)
         sys.stdout.flush()
 
     def getLine(self):
@@ -245,6 +245,7 @@ class Terminal:
     LINE_CLEAR_TO_END = "\u001b[0K"
     LINE_CLEAR_TO_START = "\u001b[1K"
     LINE_CLEAR_ALL = "\u001b[2K"
+    NON_PRINTABLE_STRS = tuple(f"/x{chCode:02x}" for chCode in range(256))
 
     def __init__(self, logHelper, stripTermColours):
         self._logHelper = logHelper
@@ -269,43 +270,51 @@ class Terminal:
         return self._running
 
     @classmethod
-    def cursorLeft(cls, moves):
-        oStr = cls.CURSOR_LEFT_N.format(moves)
-        sys.stdout.write(oStr)
+    def cursorLeftStr(cls, moves):
+        return cls.CURSOR_LEFT_N.format(moves)
 
     def handleSerialData(self, serialData: bytes):
-        termOutStr = ""
+        # Accumulate in lists and join once - repeated += on strings is quadratic
+        termOutParts = []
+        lineParts = [self._outLineBuf] if self._outLineBuf else []
+        # Per-byte state and lookups held in locals for the loop
+        stripTermColours = self._stripTermColours
+        inEsc = self._serialInEsc
+        lastChCode = self._serialLastChCode
+        termOutAppend = termOutParts.append
+        nonPrintableStrs = self.NON_PRINTABLE_STRS
         for chCode in serialData:
             termAmended = False
             termStr = ""
-            if self._serialInEsc:
-                if chCode == ord('m'): # assume escaped output is only colour info (which ends with 'm')
-                    self._serialInEsc = False
-                if self._stripTermColours:
+            if inEsc:
+                if chCode == 109: # 'm' - assume escaped output is only colour info (which ends with 'm')
+                    inEsc = False
+                if stripTermColours:
                     termAmended = True
-                    termStr = ""
             elif chCode == 27:
-                self._serialInEsc = True
-                if self._stripTermColours:
+                inEsc = True
+                if stripTermColours:
                     termAmended = True
-                    termStr = ""
             elif chCode == 10:
-                if self._serialLastChCode != 13:
-                    self._sendToLog(self._outLineBuf)
-                    self._outLineBuf = ""
+                if lastChCode != 13:
+                    self._sendToLog("".join(lineParts))
+                    lineParts = []
             elif chCode == 13:
-                if self._serialLastChCode != 10:
-                    self._sendToLog(self._outLineBuf)
-                    self._outLineBuf = ""
+                if lastChCode != 10:
+                    self._sendToLog("".join(lineParts))
+                    lineParts = []
             elif chCode == 9 or (chCode >= 32 and chCode < 127):
-                self._outLineBuf += chr(chCode)
+                lineParts.append(chr(chCode))
             else:
-                termStr = f"/x{chCode:02x}"
-                self._outLineBuf += termStr
+                termStr = nonPrintableStrs[chCode]
+                lineParts.append(termStr)
                 termAmended = True
-            self._serialLastChCode = chCode
-            termOutStr += chr(chCode) if not termAmended else termStr
-        self._sendToOutWindow(termOutStr)
+            lastChCode = chCode
+            termOutAppend(chr(chCode) if not termAmended else termStr)
+        self._serialInEsc = inEsc
+        self._serialLastChCode = lastChCode
+        self._outLineBuf = "".join(lineParts)
+        self._sendToOutWindow("".join(termOutParts))
 
     def _sendToLog(self, outStr):
         self._logHelper.info(outStr)
@@ -324,9 +333,8 @@ class Terminal:
 
     def _sendToOutWindow(self, serialData):
         if self._inputLine.isActive():
-            sys.stdout.write(self.CURSOR_UP + self.LINE_CLEAR_ALL + self.CURSOR_LINE_START)
-            sys.stdout.write(serialData)
-            sys.stdout.write(self.CURSOR_DOWN)
+            sys.stdout.write(self.CURSOR_UP + self.LINE_CLEAR_ALL + self.CURSOR_LINE_START +
+                             serialData + self.CURSOR_DOWN)
             self._inputLine.show()
         else:
             sys.stdout.write(serialData)
@@ -64,7 +64,7 @@ def convert_arg_str(args, strToConv):
 def convert_offset_str(partitionTable, strToConv):
     if strToConv[0] == '$':
         # print(strToConv[1:] in args)
-        return partitionTable[strToConv[1:]].get("offset", "")
+        return partitionTable.get(strToConv[1:], {}).get("offset", "")
     return strToConv
 
 def main():
@@ -95,16 +95,6 @@ def main():
         ["$filesysimage", "$spiffs"]
     ]
 
-    for fileToFlash in filesToFlash:
-        fileToFlash[0] = convert_arg_str(args, fileToFlash[0])
-        fileToFlash[1] = convert_offset_str(partitions, fileToFlash[1])
-    #     if fileToFlash[0] and fileToFlash[1]:
-    #         # print(fileToFlash)
-    #         subprocess.run(["esptool.py", "--chip", args.targetChip, "--port", args.port,
-    #                         "--baud", args.baud, "write_flash", "-z", "--flash_mode", "dio",
-    #                         "--flash_freq", "40m", "--flash_size", "detect", fileToFlash[1],
-    #                         str(build_folder / fileToFlash[0])])
-
     # Run esptool using partition info
     esptool_options = ['-p', f'{args.port}']
     if args.baud is not None:
@@ -119,19 +109,19 @@ def main():
 
     # Check build folder contains all the files to flash 
     # and partitions table likewise for partitions to flash into
-    for fileToFlash in filesToFlash:
-        # print(f"Args convert_arg_str {args} to {fileToFlash}")
-        flashFileName = convert_arg_str(args, fileToFlash[0])
+    for fileSpec, offsetSpec in filesToFlash:
+        flashFileName = convert_arg_str(args, fileSpec)
         if len(flashFileName) == 0:
             continue
-        if not (build_folder / flashFileName).is_file():
+        flashFilePath = build_folder / flashFileName
+        if not flashFilePath.is_file():
             _log.error(f"File {flashFileName} not found in build folder {args.build_folder}")
             raise ValueError()
-        flashOffset = convert_offset_str(partitions, fileToFlash[1])
+        flashOffset = convert_offset_str(partitions, offsetSpec)
         if len(flashOffset) == 0:
-            _log.error(f"Partition {fileToFlash[1]} not found in partition table")
+            _log.error(f"Partition {offsetSpec} not found in partition table")
             raise ValueError()
-        esptool_options += [flashOffset, str(args.build_folder / flashFileName)]
+        esptool_options += [flashOffset, str(flashFilePath)]
 
     # Form command
     esptoolPossNames = ['esptool.py.exe','esptool','esptool.py']